@@ -8,8 +8,9 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import Counter
 import re
+import threading
 from datetime import datetime
-import plotly.express as px
+from pathlib import Path
 import plotly.graph_objects as go
 
 # Configure page
@@ -44,14 +45,51 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_sample_data():
+# Optional Parquet snapshot of the sample data, written by save_sample_snapshot()
+SAMPLE_SNAPSHOT = Path(__file__).with_name('cord19_sample.parquet')
+
+# Real CORD-19 metadata, used instead of the sample data when present
+METADATA_CSV = Path(__file__).parent / 'data' / 'metadata.csv'
+METADATA_COLUMNS = ['title', 'abstract', 'publish_time', 'journal', 'source_x', 'authors']
+CSV_CHUNK_SIZE = 200_000
+
+# Filter states whose matching row positions are kept in the shared cache
+MAX_CACHED_FILTERS = 32
+
+# Columns read by analyze_data; only these are gathered for the filtered rows
+ANALYSIS_COLUMNS = ['publish_year', 'journal', 'source_x', 'abstract_word_count']
+
+# Filter states whose serialized CSV exports are kept in the cache
+MAX_CACHED_EXPORTS = 4
+
+# Fixed chart layouts, applied to figures built directly with graph_objects
+TIMELINE_LAYOUT = dict(
+    xaxis_title="Year",
+    yaxis_title="Number of Publications",
+    hovermode='x'
+)
+JOURNAL_LAYOUT = dict(
+    xaxis_title='Number of Papers',
+    yaxis=dict(title='Journal', categoryorder='total ascending')
+)
+HISTOGRAM_LAYOUT = dict(
+    title='Distribution of Abstract Word Counts',
+    xaxis_title='Word Count',
+    yaxis_title='Frequency',
+    bargap=0
+)
+TREND_LAYOUT = dict(
+    title='Average Abstract Length Over Time',
+    xaxis_title='Year',
+    yaxis_title='Average Word Count'
+)
+
+def generate_sample_data():
     """
-    Load sample CORD-19 data for demonstration
-    In real usage, this would load the actual metadata.csv file
+    Generate sample CORD-19 data for demonstration
     """
     # Create realistic sample data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     titles = [
         'COVID-19 transmission dynamics in healthcare settings',
@@ -85,124 +123,386 @@ def load_sample_data():
     
     sources = ['PubMed', 'PMC', 'bioRxiv', 'medRxiv', 'arXiv']
     
-    # Generate sample data
+    # Generate sample data (vectorized, one numpy call per column)
     n_papers = 5000
-    data = []
-    
-    for i in range(n_papers):
-        # Random publication date (weighted towards 2020-2022 for COVID-19)
-        if np.random.random() < 0.7:  # 70% from 2020-2022
-            year = np.random.choice([2020, 2021, 2022], p=[0.3, 0.4, 0.3])
-            month = np.random.randint(1, 13)
-            day = np.random.randint(1, 29)
-        else:  # 30% from other years
-            year = np.random.randint(2015, 2024)
-            month = np.random.randint(1, 13)
-            day = np.random.randint(1, 29)
-        
-        pub_date = f"{year}-{month:02d}-{day:02d}"
-        
-        # Generate abstract with realistic word count
-        abstract_length = np.random.normal(150, 50)
-        abstract_length = max(50, min(300, int(abstract_length)))
-        
-        data.append({
-            'title': np.random.choice(titles),
-            'abstract': f"Abstract with {abstract_length} words about COVID-19 research...",
-            'publish_time': pub_date,
-            'journal': np.random.choice(journals),
-            'source_x': np.random.choice(sources),
-            'authors': f"Author{i%100} et al.",
-            'abstract_word_count': abstract_length
-        })
-    
-    df = pd.DataFrame(data)
-    df['publish_time'] = pd.to_datetime(df['publish_time'])
-    df['publish_year'] = df['publish_time'].dt.year
     
+    # Random publication date (weighted towards 2020-2022 for COVID-19)
+    covid_era = rng.random(n_papers) < 0.7  # 70% from 2020-2022
+    years = np.where(
+        covid_era,
+        rng.choice([2020, 2021, 2022], size=n_papers, p=[0.3, 0.4, 0.3]),
+        rng.integers(2015, 2024, size=n_papers)
+    )
+    months = rng.integers(1, 13, size=n_papers)
+    days = rng.integers(1, 29, size=n_papers)
+    publish_time = pd.to_datetime(pd.DataFrame({'year': years, 'month': months, 'day': days}))
+    
+    # Generate abstracts with realistic word count
+    # Word counts are bounded to [50, 300], so int16 holds them at a quarter of int64's size
+    abstract_lengths = rng.normal(150, 50, size=n_papers).clip(50, 300).astype(np.int16)
+    abstract_text = np.char.add(
+        np.char.add('Abstract with ', abstract_lengths.astype(str)),
+        ' words about COVID-19 research...'
+    )
+    authors = np.char.add(
+        np.char.add('Author', (np.arange(n_papers) % 100).astype(str)),
+        ' et al.'
+    )
+    
+    df = pd.DataFrame({
+        'title': rng.choice(titles, size=n_papers),
+        'abstract': abstract_text,
+        'publish_time': publish_time,
+        'journal': rng.choice(journals, size=n_papers),
+        'source_x': rng.choice(sources, size=n_papers),
+        'authors': authors,
+        'abstract_word_count': abstract_lengths
+    })
+    df['publish_year'] = years
+    
+    return encode_columns(df)
+
+def encode_columns(df):
+    """
+    Add the encoded columns the dashboard relies on
+    """
+    # Dictionary-encode the low-cardinality string columns
+    df['journal'] = df['journal'].astype('category')
+    df['source_x'] = df['source_x'].astype('category')
+    
+    # Lowercased titles for the search box, computed once instead of per query
+    df['_title_lc'] = df['title'].str.lower()
+    
+    return set_year_bounds(df)
+
+def set_year_bounds(df):
+    """
+    Record the publication year range in df.attrs for the year slider
+    """
+    df.attrs['year_min'] = int(df['publish_year'].min())
+    df.attrs['year_max'] = int(df['publish_year'].max())
     return df
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
+def load_sample_data():
+    """
+    Load sample CORD-19 data for demonstration
+    Reads the Parquet snapshot when available, otherwise generates the data
+    In real usage, this would load the actual metadata.csv file
+    The returned DataFrame is shared across sessions and must not be mutated
+    """
+    if SAMPLE_SNAPSHOT.exists():
+        try:
+            return set_year_bounds(pd.read_parquet(SAMPLE_SNAPSHOT, engine='pyarrow'))
+        except ImportError:
+            # pyarrow is optional; fall back to generating the data
+            pass
+    
+    return generate_sample_data()
+
+def save_sample_snapshot(path=SAMPLE_SNAPSHOT):
+    """
+    Write the generated sample data to Parquet for faster cold starts
+    """
+    generate_sample_data().to_parquet(path, engine='pyarrow', index=False)
+
+def count_values(values):
+    """
+    Count occurrences of each value with np.unique, returned as a Series
+    indexed by the (sorted) unique values. Meant for numeric columns such as
+    publish_year; use count_categories for categorical columns.
+    """
+    uniques, counts = np.unique(values, return_counts=True)
+    return pd.Series(counts, index=uniques)
+
+def count_categories(series):
+    """
+    Count occurrences of each observed category of a categorical Series with
+    np.bincount over its integer codes, indexed by category
+    """
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    observed = counts > 0
+    return pd.Series(counts[observed], index=series.cat.categories[observed])
+
+def top_n_counts(counts, n):
+    """
+    Return the n largest entries of a count Series, largest first.
+    np.argpartition selects the top n so only those n are sorted.
+    """
+    values = counts.to_numpy()
+    if len(values) > n:
+        top = np.argpartition(-values, n - 1)[:n]
+    else:
+        top = np.arange(len(values))
+    order = top[np.argsort(-values[top], kind='stable')]
+    return counts.iloc[order]
+
+def format_dates(dates, fmt='%Y-%m-%d'):
+    """
+    Format a datetime Series as strings, calling strftime once per unique date
+    """
+    codes, uniques = pd.factorize(dates)
+    # Missing dates factorize to -1, which picks up the trailing None
+    formatted = np.append(np.asarray(pd.DatetimeIndex(uniques).strftime(fmt), dtype=object), None)
+    return pd.Series(formatted[codes], index=dates.index)
+
+def yearly_mean_length(df):
+    """
+    Average abstract word count per publication year, computed with two
+    np.bincount passes over the year offsets instead of a pandas groupby
+    """
+    years = df['publish_year'].to_numpy(np.int64)
+    if len(years) == 0:
+        return pd.DataFrame({'publish_year': [], 'abstract_word_count': []})
+    
+    year_min = years.min()
+    codes = years - year_min
+    sums = np.bincount(codes, weights=df['abstract_word_count'].to_numpy(np.float64))
+    counts = np.bincount(codes)
+    
+    observed = counts > 0
+    return pd.DataFrame({
+        'publish_year': np.flatnonzero(observed) + year_min,
+        'abstract_word_count': sums[observed] / counts[observed]
+    })
+
 def analyze_data(df):
     """
     Perform data analysis and return results
     """
     results = {}
     
+    # Paper and journal totals
+    results['total_papers'] = len(df)
+    results['journal_counts'] = count_categories(df['journal'])
+    results['unique_journals'] = len(results['journal_counts'])
+    
     # Publications by year
-    results['yearly_counts'] = df['publish_year'].value_counts().sort_index()
+    results['yearly_counts'] = count_values(df['publish_year'].to_numpy())
+    results['min_year'] = results['yearly_counts'].index.min()
+    results['max_year'] = results['yearly_counts'].index.max()
     
     # Top journals
-    results['top_journals'] = df['journal'].value_counts().head(10)
+    results['top_journals'] = top_n_counts(results['journal_counts'], 10)
     
     # Source distribution
-    results['source_counts'] = df['source_x'].value_counts()
+    results['source_counts'] = count_categories(df['source_x']).sort_values(ascending=False)
     
     # Word count statistics
     results['avg_abstract_length'] = df['abstract_word_count'].mean()
     results['median_abstract_length'] = df['abstract_word_count'].median()
+    results['yearly_mean_length'] = yearly_mean_length(df)
     
     return results
 
-def create_publication_timeline(df, year_range):
+def prepare_metadata_chunk(chunk):
     """
-    Create interactive timeline of publications
+    Clean one chunk of metadata.csv and derive the dashboard columns
     """
-    filtered_df = df[
-        (df['publish_year'] >= year_range[0]) & 
-        (df['publish_year'] <= year_range[1])
-    ]
+    # CORD-19 mixes year-only "2020" with full "2020-03-01" dates, so parse
+    # each value on its own rather than inferring one format per chunk
+    chunk['publish_time'] = pd.to_datetime(chunk['publish_time'], format='mixed', errors='coerce')
+    chunk = chunk.dropna(subset=['publish_time'])
+    
+    return chunk.assign(
+        title=chunk['title'].fillna(''),
+        journal=chunk['journal'].fillna('Unknown'),
+        source_x=chunk['source_x'].fillna('Unknown'),
+        publish_year=chunk['publish_time'].dt.year,
+        abstract_word_count=chunk['abstract'].fillna('').str.split().str.len()
+            .clip(upper=np.iinfo(np.int16).max).astype(np.int16)
+    )
+
+def load_metadata_progressively(path=METADATA_CSV, chunksize=CSV_CHUNK_SIZE):
+    """
+    Stream metadata.csv in chunks, redrawing the publication timeline after
+    each chunk so partial results show before the whole file is read
+    """
+    chunks = []
+    n_skipped = 0
+    yearly_counts = pd.Series(dtype=np.int64)
+    
+    with st.status("Loading metadata.csv...", expanded=True) as status:
+        preview = st.empty()
+        for raw_chunk in pd.read_csv(path, usecols=METADATA_COLUMNS, chunksize=chunksize):
+            chunk = prepare_metadata_chunk(raw_chunk)
+            n_skipped += len(raw_chunk) - len(chunk)
+            chunks.append(chunk)
+            
+            # Update the running yearly counts instead of re-concatenating every chunk
+            chunk_counts = count_values(chunk['publish_year'].to_numpy())
+            yearly_counts = yearly_counts.add(chunk_counts, fill_value=0).astype(np.int64)
+            n_loaded = int(yearly_counts.sum())
+            
+            fig = go.Figure(go.Scattergl(
+                x=yearly_counts.index,
+                y=yearly_counts.values,
+                mode='lines+markers'
+            ))
+            fig.update_layout(title=f'Publications by Year (loaded {n_loaded:,} papers)', **TIMELINE_LAYOUT)
+            preview.plotly_chart(fig, use_container_width=True)
+            status.update(label=f"Loading metadata.csv... {n_loaded:,} papers")
+        
+        df = encode_columns(pd.concat(chunks, ignore_index=True))
+        preview.empty()
+        status.update(label=f"Loaded {len(df):,} papers from metadata.csv", state='complete', expanded=False)
     
-    yearly_counts = filtered_df['publish_year'].value_counts().sort_index()
+    if n_skipped:
+        st.warning(f"Skipped {n_skipped:,} rows of metadata.csv without a readable publish_time")
     
-    fig = px.line(
-        x=yearly_counts.index, 
-        y=yearly_counts.values,
-        title=f'Publications by Year ({year_range[0]}-{year_range[1]})',
-        labels={'x': 'Year', 'y': 'Number of Publications'},
-        markers=True
+    return df
+
+@st.cache_resource(show_spinner=False)
+def dataset_store():
+    """
+    Process-wide holder for the loaded dataset (not hashed or copied per rerun).
+    The DataFrame is shared by every session, so callers must treat it as read-only.
+    The lock makes sure only one session loads it.
+    """
+    return {'lock': threading.Lock()}
+
+def get_dataset():
+    """
+    Shared handle on the loaded dataset. The first call loads it: the real
+    metadata.csv (streamed with progressive rendering) if present, otherwise
+    the sample data. Loading happens outside the cached function so the
+    progress UI is not replayed on every rerun.
+    """
+    store = dataset_store()
+    if 'df' not in store:
+        with store['lock']:
+            # Another session may have finished loading while we waited
+            if 'df' not in store:
+                if METADATA_CSV.exists():
+                    store['df'] = load_metadata_progressively()
+                else:
+                    store['df'] = load_sample_data()
+    return store['df']
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FILTERS)
+def get_filtered(df_id, year_range, sources_tuple):
+    """
+    Find the positions of the rows matching the filter state and compute the
+    aggregates used across the dashboard. Memoized on the filter state so
+    repeated selections return instantly; only row positions are cached, not
+    copies of the rows, and the results are shared, so treat them as read-only.
+    """
+    df = get_dataset()
+
+    mask = (
+        (df['publish_year'] >= year_range[0]) &
+        (df['publish_year'] <= year_range[1]) &
+        (df['source_x'].isin(sources_tuple))
     )
+    rows = np.flatnonzero(mask.to_numpy())
+
+    return rows, analyze_data(df[ANALYSIS_COLUMNS].iloc[rows])
+
+def build_summary_df(results):
+    """
+    Build the summary statistics table from precomputed analysis results
+    """
+    yearly_counts = results['yearly_counts']
+    summary_stats = {
+        'Total Papers': results['total_papers'],
+        'Unique Journals': results['unique_journals'],
+        'Date Range': f"{results['min_year']}-{results['max_year']}",
+        'Avg Abstract Length': f"{results['avg_abstract_length']:.1f} words",
+        'Most Productive Year': yearly_counts.idxmax() if len(yearly_counts) > 0 else 'N/A',
+        'Top Journal': results['top_journals'].index[0] if results['total_papers'] > 0 else 'N/A'
+    }
     
+    return pd.DataFrame(list(summary_stats.items()), columns=['Metric', 'Value'])
+
+@st.cache_data(show_spinner=False)
+def summary_csv_bytes(df_id, year_range, sources_tuple):
+    """
+    Serialize the summary statistics to CSV once per filter state
+    """
+    analysis_results = get_filtered(df_id, year_range, sources_tuple)[1]
+    return build_summary_df(analysis_results).to_csv(index=False).encode('utf-8')
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FILTERS)
+def search_titles(df_id, year_range, sources_tuple, search_term):
+    """
+    Return the positions of the filtered papers whose title matches the search term
+    """
+    rows = get_filtered(df_id, year_range, sources_tuple)[0]
+    titles = get_dataset()['_title_lc'].iloc[rows]
+    return rows[titles.str.contains(search_term.lower(), regex=False, na=False).to_numpy()]
+
+@st.cache_data(show_spinner=False, max_entries=MAX_CACHED_EXPORTS)
+def to_csv_bytes(df_id, year_range, sources_tuple):
+    """
+    Serialize the filtered papers to CSV once per filter state
+    """
+    rows = get_filtered(df_id, year_range, sources_tuple)[0]
+    return get_dataset().iloc[rows].drop(columns='_title_lc').to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def abstract_length_histogram(df_id, year_range, sources_tuple, bins=30):
+    """
+    Bin the filtered abstract word counts once per filter state
+    """
+    rows = get_filtered(df_id, year_range, sources_tuple)[0]
+    values = get_dataset()['abstract_word_count'].to_numpy()[rows]
+    if len(values) == 0:
+        return np.histogram(values, bins=bins)
+    
+    # Word counts are integers: round the bin width up to a whole 1/2/5 x 10^k
+    # step with edges on multiples of it, so bins hold equal runs of integers
+    lo, hi = int(values.min()), int(values.max())
+    raw_step = max(1, -(-(hi - lo + 1) // bins))
+    magnitude = 10 ** (len(str(raw_step)) - 1)
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+    edges = np.arange(lo - lo % step, hi + step + 1, step)
+    return np.histogram(values, bins=edges)
+
+def create_publication_timeline(yearly_counts, year_range):
+    """
+    Create interactive timeline of publications from precomputed yearly counts
+    """
+    fig = go.Figure(go.Scattergl(
+        x=yearly_counts.index,
+        y=yearly_counts.values,
+        mode='lines+markers'
+    ))
     fig.update_layout(
-        xaxis_title="Year",
-        yaxis_title="Number of Publications",
-        hovermode='x'
+        title=f'Publications by Year ({year_range[0]}-{year_range[1]})',
+        **TIMELINE_LAYOUT
     )
     
     return fig
 
-def create_journal_chart(df, top_n):
+def create_journal_chart(journal_counts, top_n):
     """
-    Create horizontal bar chart of top journals
+    Create horizontal bar chart of top journals from precomputed journal counts
     """
-    top_journals = df['journal'].value_counts().head(top_n)
+    top_journals = top_n_counts(journal_counts, top_n)
     
-    fig = px.bar(
+    fig = go.Figure(go.Bar(
         x=top_journals.values,
-        y=top_journals.index,
-        orientation='h',
-        title=f'Top {top_n} Publishing Journals',
-        labels={'x': 'Number of Papers', 'y': 'Journal'}
-    )
-    
+        y=top_journals.index.astype(str),
+        orientation='h'
+    ))
     fig.update_layout(
-        yaxis={'categoryorder': 'total ascending'},
-        height=400 + (top_n * 20)
+        title=f'Top {top_n} Publishing Journals',
+        height=400 + (top_n * 20),
+        **JOURNAL_LAYOUT
     )
     
     return fig
 
-def create_source_pie_chart(df):
+def create_source_pie_chart(source_counts):
     """
-    Create pie chart of source distribution
+    Create pie chart of source distribution from precomputed source counts
     """
-    source_counts = df['source_x'].value_counts()
-    
-    fig = px.pie(
+    fig = go.Figure(go.Pie(
         values=source_counts.values,
-        names=source_counts.index,
-        title='Distribution of Papers by Source'
-    )
+        labels=source_counts.index.astype(str)
+    ))
+    fig.update_layout(title='Distribution of Papers by Source')
     
     return fig
 
@@ -224,8 +524,7 @@ def main():
     
     # Load data
     with st.spinner("Loading data..."):
-        df = load_sample_data()
-        analysis_results = analyze_data(df)
+        df = get_dataset()
     
     st.sidebar.success(f"✅ Loaded {len(df):,} papers")
     
@@ -233,7 +532,7 @@ def main():
     st.sidebar.subheader("🔧 Filters")
     
     # Year range slider
-    min_year, max_year = int(df['publish_year'].min()), int(df['publish_year'].max())
+    min_year, max_year = df.attrs['year_min'], df.attrs['year_max']
     year_range = st.sidebar.slider(
         "Publication Year Range",
         min_value=min_year,
@@ -250,7 +549,8 @@ def main():
     )
     
     # Source filter
-    available_sources = df['source_x'].unique().tolist()
+    # source_x is categorical, so its categories are the available sources
+    available_sources = df['source_x'].cat.categories.tolist()
     selected_sources = st.sidebar.multiselect(
         "Select Sources",
         options=available_sources,
@@ -258,11 +558,11 @@ def main():
     )
     
     # Filter data based on selections
-    filtered_df = df[
-        (df['publish_year'] >= year_range[0]) & 
-        (df['publish_year'] <= year_range[1]) &
-        (df['source_x'].isin(selected_sources))
-    ]
+    sources_tuple = tuple(sorted(selected_sources))
+    rows, analysis_results = get_filtered(id(df), year_range, sources_tuple)
+    n_filtered = analysis_results['total_papers']
+    yearly_counts = analysis_results['yearly_counts']
+    avg_length = analysis_results['avg_abstract_length']
     
     # Main dashboard
     # Key metrics
@@ -271,25 +571,24 @@ def main():
     with col1:
         st.metric(
             "Total Papers",
-            f"{len(filtered_df):,}",
-            delta=f"{len(filtered_df) - len(df):,}" if len(filtered_df) != len(df) else None
+            f"{n_filtered:,}",
+            delta=f"{n_filtered - len(df):,}" if n_filtered != len(df) else None
         )
     
     with col2:
         st.metric(
             "Unique Journals",
-            f"{filtered_df['journal'].nunique():,}"
+            f"{analysis_results['unique_journals']:,}"
         )
     
     with col3:
-        avg_length = filtered_df['abstract_word_count'].mean()
         st.metric(
             "Avg Abstract Length",
             f"{avg_length:.0f} words"
         )
     
     with col4:
-        date_range = filtered_df['publish_year'].max() - filtered_df['publish_year'].min()
+        date_range = analysis_results['max_year'] - analysis_results['min_year']
         st.metric(
             "Year Range",
             f"{date_range + 1} years"
@@ -301,7 +600,7 @@ def main():
     st.header("📈 Publication Trends")
     
     # Timeline chart
-    timeline_fig = create_publication_timeline(filtered_df, year_range)
+    timeline_fig = create_publication_timeline(yearly_counts, year_range)
     st.plotly_chart(timeline_fig, use_container_width=True)
     
     # Two column layout for charts
@@ -309,12 +608,12 @@ def main():
     
     with col1:
         st.subheader("📚 Top Publishing Journals")
-        journal_fig = create_journal_chart(filtered_df, top_n_journals)
+        journal_fig = create_journal_chart(analysis_results['journal_counts'], top_n_journals)
         st.plotly_chart(journal_fig, use_container_width=True)
     
     with col2:
         st.subheader("🔗 Source Distribution")
-        source_fig = create_source_pie_chart(filtered_df)
+        source_fig = create_source_pie_chart(analysis_results['source_counts'])
         st.plotly_chart(source_fig, use_container_width=True)
     
     st.divider()
@@ -323,10 +622,12 @@ def main():
     st.header("💡 Key Insights")
     
     # Most productive year
-    yearly_counts = filtered_df['publish_year'].value_counts().sort_index()
     if len(yearly_counts) > 0:
-        most_productive_year = yearly_counts.idxmax()
-        max_papers = yearly_counts.max()
+        years_arr = yearly_counts.index.to_numpy()
+        counts_arr = yearly_counts.to_numpy()
+        peak = counts_arr.argmax()
+        most_productive_year = years_arr[peak]
+        max_papers = counts_arr[peak]
         
         col1, col2, col3 = st.columns(3)
         
@@ -339,8 +640,9 @@ def main():
             """.format(most_productive_year, max_papers), unsafe_allow_html=True)
         
         with col2:
-            top_journal = filtered_df['journal'].value_counts().index[0]
-            top_journal_count = filtered_df['journal'].value_counts().iloc[0]
+            top_journals = analysis_results['top_journals']
+            top_journal = top_journals.index[0]
+            top_journal_count = top_journals.iloc[0]
             st.markdown("""
             <div class="insight-box">
                 <h4>🏆 Leading Journal</h4>
@@ -349,8 +651,9 @@ def main():
             """.format(top_journal, top_journal_count), unsafe_allow_html=True)
         
         with col3:
-            covid_peak = yearly_counts[yearly_counts.index >= 2020].max() if any(yearly_counts.index >= 2020) else 0
-            pre_covid = yearly_counts[yearly_counts.index < 2020].max() if any(yearly_counts.index < 2020) else 1
+            covid_mask = years_arr >= 2020
+            covid_peak = counts_arr.max(where=covid_mask, initial=0)
+            pre_covid = counts_arr.max(where=~covid_mask, initial=1)
             increase = ((covid_peak - pre_covid) / pre_covid * 100) if pre_covid > 0 else 0
             st.markdown("""
             <div class="insight-box">
@@ -368,37 +671,35 @@ def main():
     
     with col1:
         # Abstract length distribution
-        fig_hist = px.histogram(
-            filtered_df,
-            x='abstract_word_count',
-            nbins=30,
-            title='Distribution of Abstract Word Counts',
-            labels={'abstract_word_count': 'Word Count', 'count': 'Frequency'}
-        )
+        # Bin server-side so the browser only receives the bar heights
+        counts, edges = abstract_length_histogram(id(df), year_range, sources_tuple)
+        fig_hist = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges)
+        ))
+        fig_hist.update_layout(**HISTOGRAM_LAYOUT)
         
         # Add mean line
-        mean_length = filtered_df['abstract_word_count'].mean()
         fig_hist.add_vline(
-            x=mean_length, 
+            x=avg_length, 
             line_dash="dash", 
             line_color="red",
-            annotation_text=f"Mean: {mean_length:.0f} words"
+            annotation_text=f"Mean: {avg_length:.0f} words"
         )
         
         st.plotly_chart(fig_hist, use_container_width=True)
     
     with col2:
         # Abstract length by year
-        yearly_avg_length = filtered_df.groupby('publish_year')['abstract_word_count'].mean().reset_index()
+        yearly_avg_length = analysis_results['yearly_mean_length']
         
-        fig_trend = px.line(
-            yearly_avg_length,
-            x='publish_year',
-            y='abstract_word_count',
-            title='Average Abstract Length Over Time',
-            labels={'publish_year': 'Year', 'abstract_word_count': 'Average Word Count'},
-            markers=True
-        )
+        fig_trend = go.Figure(go.Scattergl(
+            x=yearly_avg_length['publish_year'],
+            y=yearly_avg_length['abstract_word_count'],
+            mode='lines+markers'
+        ))
+        fig_trend.update_layout(**TREND_LAYOUT)
         
         st.plotly_chart(fig_trend, use_container_width=True)
     
@@ -407,15 +708,16 @@ def main():
     # Sample data table
     st.header("📋 Sample Data")
     
-    # Search functionality
-    search_term = st.text_input("🔍 Search in titles:", placeholder="Enter keywords to search...")
+    # Search functionality (in a form so the search only runs on submit, not per keystroke)
+    with st.form("title_search"):
+        search_term = st.text_input("🔍 Search in titles:", placeholder="Enter keywords to search...")
+        st.form_submit_button("Search")
     
     # Filter by search term
-    display_df = filtered_df.copy()
+    display_rows = rows
     if search_term:
-        mask = display_df['title'].str.contains(search_term, case=False, na=False)
-        display_df = display_df[mask]
-        st.info(f"Found {len(display_df)} papers matching '{search_term}'")
+        display_rows = search_titles(id(df), year_range, sources_tuple, search_term)
+        st.info(f"Found {len(display_rows)} papers matching '{search_term}'")
     
     # Display options
     col1, col2, col3 = st.columns(3)
@@ -426,18 +728,25 @@ def main():
     with col3:
         sort_order = st.selectbox("Order:", ['Descending', 'Ascending'])
     
-    # Sort and display data
+    # Sort only the sort column of the matching rows, then gather the rows shown
     ascending = sort_order == 'Ascending'
-    display_df_sorted = display_df.sort_values(sort_column, ascending=ascending)
+    sort_keys = df[sort_column].iloc[display_rows].reset_index(drop=True)
+    top = sort_keys.sort_values(ascending=ascending).head(rows_to_show).index.to_numpy()
     
     # Select columns to display
     columns_to_show = ['title', 'journal', 'publish_time', 'abstract_word_count', 'source_x']
-    display_data = display_df_sorted[columns_to_show].head(rows_to_show)
-    
-    # Format the display
-    display_data = display_data.copy()
-    display_data['publish_time'] = display_data['publish_time'].dt.strftime('%Y-%m-%d')
-    display_data.columns = ['Title', 'Journal', 'Publication Date', 'Abstract Words', 'Source']
+    display_data = df.iloc[display_rows[top]][columns_to_show]
+    
+    # Format the display (assign/rename return new frames, so only the head slice is touched)
+    display_data = display_data.assign(
+        publish_time=format_dates(display_data['publish_time'])
+    ).rename(columns={
+        'title': 'Title',
+        'journal': 'Journal',
+        'publish_time': 'Publication Date',
+        'abstract_word_count': 'Abstract Words',
+        'source_x': 'Source'
+    })
     
     st.dataframe(
         display_data,
@@ -457,37 +766,33 @@ def main():
     # Download section
     st.header("💾 Export Data")
     
+    today = datetime.now().strftime('%Y%m%d')
     col1, col2 = st.columns(2)
     
     with col1:
-        # CSV download
-        csv_data = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="📄 Download Filtered Data (CSV)",
-            data=csv_data,
-            file_name=f"cord19_filtered_data_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv",
-            help="Download the current filtered dataset as CSV"
-        )
+        # CSV download, serialized only once the user asks for it
+        filter_key = (year_range, sources_tuple)
+        if st.button("📦 Prepare Filtered Data (CSV)", help="Build the CSV export for the current filters"):
+            st.session_state['csv_export_filter'] = filter_key
+        
+        if st.session_state.get('csv_export_filter') == filter_key:
+            csv_data = to_csv_bytes(id(df), year_range, sources_tuple)
+            st.download_button(
+                label="📄 Download Filtered Data (CSV)",
+                data=csv_data,
+                file_name=f"cord19_filtered_data_{today}.csv",
+                mime="text/csv",
+                help="Download the current filtered dataset as CSV"
+            )
     
     with col2:
         # Summary statistics download
-        summary_stats = {
-            'Total Papers': len(filtered_df),
-            'Unique Journals': filtered_df['journal'].nunique(),
-            'Date Range': f"{filtered_df['publish_year'].min()}-{filtered_df['publish_year'].max()}",
-            'Avg Abstract Length': f"{filtered_df['abstract_word_count'].mean():.1f} words",
-            'Most Productive Year': yearly_counts.idxmax() if len(yearly_counts) > 0 else 'N/A',
-            'Top Journal': filtered_df['journal'].value_counts().index[0] if len(filtered_df) > 0 else 'N/A'
-        }
-        
-        summary_df = pd.DataFrame(list(summary_stats.items()), columns=['Metric', 'Value'])
-        summary_csv = summary_df.to_csv(index=False)
+        summary_csv = summary_csv_bytes(id(df), year_range, sources_tuple)
         
         st.download_button(
             label="📊 Download Summary Statistics",
             data=summary_csv,
-            file_name=f"cord19_summary_{datetime.now().strftime('%Y%m%d')}.csv",
+            file_name=f"cord19_summary_{today}.csv",
             mime="text/csv",
             help="Download summary statistics of the analysis"
         )
@@ -512,7 +817,7 @@ def main():
         **Data Source:** CORD-19 Dataset (COVID-19 Open Research Dataset)
         
         **Note:** This dashboard uses sample data for demonstration. To use with real CORD-19 data, 
-        replace the `load_sample_data()` function with code to load the actual metadata.csv file.
+        place the actual metadata.csv file at `data/metadata.csv`; it is loaded in chunks on first start.
         
         **Created with:** Streamlit, Plotly, Pandas
         """)
@@ -520,9 +825,9 @@ def main():
     # Sidebar info
     st.sidebar.divider()
     st.sidebar.markdown("### 📈 Dashboard Stats")
-    st.sidebar.metric("Filtered Papers", f"{len(filtered_df):,}")
+    st.sidebar.metric("Filtered Papers", f"{n_filtered:,}")
     st.sidebar.metric("Original Dataset", f"{len(df):,}")
-    st.sidebar.metric("Filter Efficiency", f"{len(filtered_df)/len(df)*100:.1f}%")
+    st.sidebar.metric("Filter Efficiency", f"{n_filtered/len(df)*100:.1f}%")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file